@@ -2,7 +2,7 @@ import sys
 import os
 import ast
 import numpy as np
-import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 from scipy.signal import butter, filtfilt, find_peaks
 
@@ -189,8 +189,7 @@ class AnalyzerWindow(QMainWindow):
         try:
             # 1. Load Parquet Data
             table = pq.read_table(self.selected_file)
-            df = table.to_pandas()
-            
+
             schema = table.schema
             metadata_bytes = schema.metadata.get(b'session_meta', b'{}')
             try:
@@ -203,21 +202,53 @@ class AnalyzerWindow(QMainWindow):
             fps = float(meta.get('Frame rate', "15.1").split()[0])
             dop_max = float(meta.get('Max velocity', "20.16").replace('±','').replace(' m/s',''))
             
-            total_frames = len(df)
+            total_frames = table.num_rows
             time_axis = np.arange(total_frames) / fps
             duration_minutes = total_frames / fps / 60.0
 
             # 2. Reconstruct Matrices
-            rdhm_cube = np.zeros((total_frames, num_range_bins, num_vel_bins), dtype=np.float32)
-            for i, row in df.iterrows():
-                raw = np.frombuffer(row['rdhm_bytes'], dtype=np.uint16)
-                if raw.size == num_range_bins * num_vel_bins:
-                    rd = raw.astype(np.float32).reshape(num_range_bins, num_vel_bins)
-                    rd = np.abs(np.fft.fftshift(rd, axes=1))
-                    rdhm_cube[i] = rd
-
-            rdhm_db = 20 * np.log10(rdhm_cube + 1e-6)
-            spectrogram = np.max(rdhm_db, axis=1)
+            # np.empty, not np.zeros: every row is fully overwritten below, so
+            # zero-filling the whole cube up front would be a wasted write pass
+            rdhm_cube = np.empty((total_frames, num_range_bins, num_vel_bins), dtype=np.float32)
+
+            expected_bytes = num_range_bins * num_vel_bins * 2   # uint16 frames
+            col = table.column('rdhm_bytes')
+
+            if pa.types.is_fixed_size_binary(col.type) and col.type.byte_width == expected_bytes:
+                # Zero-copy path (files from the current streamer): Arrow keeps
+                # a FixedSizeBinary column as one contiguous buffer, so the
+                # whole session is viewable as uint16 without materialising a
+                # single per-row bytes object
+                data_buf = col.combine_chunks().buffers()[1]
+                raw_all = np.frombuffer(data_buf, dtype=np.uint16,
+                                        count=total_frames * num_range_bins * num_vel_bins)
+                cube_u16 = raw_all.reshape(total_frames, num_range_bins, num_vel_bins)
+                rdhm_cube[:] = cube_u16
+            else:
+                blobs = col.to_pylist()
+                if all(len(b) == expected_bytes for b in blobs):
+                    # Older variable-width files: one join + one frombuffer
+                    # decodes the whole session in a single shot
+                    raw_all = np.frombuffer(b''.join(blobs), dtype=np.uint16)
+                    cube_u16 = raw_all.reshape(total_frames, num_range_bins, num_vel_bins)
+                    rdhm_cube[:] = cube_u16
+                else:
+                    # Fallback for sessions with corrupt/short frames
+                    for i, b in enumerate(blobs):
+                        raw = np.frombuffer(b, dtype=np.uint16)
+                        if raw.size * 2 == expected_bytes:
+                            rdhm_cube[i] = raw.reshape(num_range_bins, num_vel_bins)
+                        else:
+                            rdhm_cube[i] = 0.0   # blank corrupt frames explicitly
+
+            # log10 is monotonic, so the max-over-range reduction commutes with
+            # the dB conversion: reduce the cube first, then convert only the
+            # small (frames, velocity) result — the full dB cube of the whole
+            # session is never materialised. The Doppler fftshift likewise
+            # commutes with the max over range (it only permutes velocity
+            # columns), so it too is applied after the reduction — shifting the
+            # 2-D plane instead of the full cube
+            spectrogram = 20 * np.log10(np.fft.fftshift(rdhm_cube.max(axis=1), axes=1) + 1e-6)
 
             # --- VISUAL FIX FOR SPECTROGRAM ---
             # The center bin (stationary clutter) is so loud it ruins the visual color scale.
@@ -228,8 +259,11 @@ class AnalyzerWindow(QMainWindow):
             vis_spectrogram[:, center_bin-1:center_bin+2] = floor_val
 
             # 3. Extract Cadence Signal (Skipping the center bins)
-            moving_bins = list(range(0, center_bin - 2)) + list(range(center_bin + 3, num_vel_bins))
-            movement_signal = np.sum(spectrogram[:, moving_bins], axis=1)
+            # Two contiguous slice sums instead of fancy-indexing a bin list:
+            # slices are views (no gather copy) and the sums run over
+            # sequential memory
+            movement_signal = (spectrogram[:, :center_bin - 2].sum(axis=1)
+                               + spectrogram[:, center_bin + 3:].sum(axis=1))
 
             normal_max = np.percentile(movement_signal, 99.5)
             movement_signal = np.clip(movement_signal, a_min=None, a_max=normal_max)
@@ -0,0 +1,90 @@
+import math         # math.log10/abs inside the JIT kernel — numba lowers these to libm calls
+import logging
+
+import numpy as np
+
+log = logging.getLogger(__name__)   # module-level logger, name = "core.kernels"
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Per-frame number crunching
+#  Numba is an optional accelerator: when it is installed the kernels below
+#  are JIT-compiled to native, parallel code; when it is missing we fall back
+#  to equivalent in-place NumPy pipelines.  Callers never need to know which
+#  path is active.
+# ─────────────────────────────────────────────────────────────────────────────
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# dB via log2 instead of log10: 20*log10(x) == (20/log2(10)) * log2(x).
+# log2 is the cheapest of the libm log variants, and the constant folds into
+# the existing scale multiply, so the identity is free.
+_DB_PER_LOG2 = 20.0 / math.log2(10.0)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _to_db_jit(buf):
+        # One fused pass over the matrix: |x| -> +eps -> log10 -> ×20.
+        # Each element is loaded and stored exactly once, so the kernel is
+        # bounded by memory bandwidth instead of five separate ufunc passes.
+        # The DSP delivers non-negative uint16 magnitudes, so no abs() is
+        # needed before the log
+        rows, cols = buf.shape
+        for i in prange(rows):
+            for j in range(cols):
+                buf[i, j] = _DB_PER_LOG2 * math.log2(buf[i, j] + 1e-6)
+
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _shift_to_db_jit(rd, out):
+        # Fused Doppler-shift + dB conversion: instead of materialising a
+        # shifted copy of the matrix first, the shift is plain index
+        # arithmetic inside the loop, so the raw frame is read exactly once
+        # and the dB result written exactly once.
+        rows, cols = out.shape
+        half = cols // 2
+        for i in prange(rows):
+            for j in range(cols):
+                js = j - half if j >= half else j + half
+                out[i, j] = _DB_PER_LOG2 * math.log2(rd[i, js] + 1e-6)
+
+
+def to_db(buf: np.ndarray):
+    """Convert a float32 magnitude matrix to dB, in place."""
+    if NUMBA_AVAILABLE:
+        _to_db_jit(buf)
+    else:
+        # NumPy fallback: same math, three in-place passes instead of one
+        buf += 1e-6
+        np.log2(buf, out=buf)
+        buf *= _DB_PER_LOG2
+
+
+def shift_to_db(rd: np.ndarray, out: np.ndarray):
+    """Doppler-shift (fftshift along axis 1) and dB-convert `rd` into `out`.
+
+    `rd` is the cropped raw uint16 matrix; `out` is a float32 buffer of the
+    same shape that is fully overwritten.
+    """
+    if NUMBA_AVAILABLE:
+        _shift_to_db_jit(rd, out)
+    else:
+        # NumPy fallback: two contiguous half-column copies do the shift and
+        # the uint16 -> float32 conversion, then the dB math runs in place
+        half = out.shape[1] // 2
+        out[:, :half] = rd[:, half:]
+        out[:, half:] = rd[:, :half]
+        to_db(out)
+
+
+def warmup(shape: tuple = (8, 8)):
+    # Run each kernel once on a dummy matrix at startup so JIT compilation
+    # doesn't stall the first real frame.  cache=True persists the compiled
+    # objects on disk, so after the first ever run this is near-instant.
+    to_db(np.ones(shape, dtype=np.float32))
+    shift_to_db(np.ones(shape, dtype=np.uint16), np.empty(shape, dtype=np.float32))
@@ -1,5 +1,6 @@
 import time                          # for sleep() during config sending and close()
 import logging                       # for warning/error messages without crashing
+import struct                        # pre-compiled Struct for the frame-length field
 import serial                        # pyserial — talks to the radar over USB-UART
 from serial.tools import list_ports  # used by find_ti_ports() to scan connected USB devices
 
@@ -10,6 +11,8 @@ log = logging.getLogger(__name__)   # module-level logger, name = "sensor"
 _MAGIC  = b"\x02\x01\x04\x03\x06\x05\x08\x07"   # 8-byte sync word that starts every radar packet
 _TI_VID = 0x0451                                  # TI's USB Vendor ID — used to identify the device
 
+_U32 = struct.Struct("<I")   # little-endian uint32 — reads the frame-length header field
+
 
 class RadarSensor:
     """
@@ -85,7 +88,26 @@ class RadarSensor:
         binary frame.  Returns the frame bytes if a full frame is ready, otherwise None.
         The caller should loop calling this until it gets a non-None result.
         """
+        if not self._fill_buffer():
+            return None
+        return self._extract_frame()
 
+    def read_available_frames(self) -> list[bytes]:
+        """
+        Batched variant: drain the serial buffer once, then extract every complete
+        frame it contains.  A single driver/syscall round-trip can cover several
+        frames when the consumer briefly falls behind the radar.
+        Returns an empty list if no complete frame is ready yet.
+        """
+        frames = []
+        if self._fill_buffer():
+            while (frame := self._extract_frame()) is not None:
+                frames.append(frame)
+        return frames
+
+    def _fill_buffer(self) -> bool:
+        # Pull whatever the OS has buffered into self._buffer.
+        # Returns False only when a blocking read timed out with no data.
         in_waiting = self._data.in_waiting   # how many bytes are sitting unread in the OS serial buffer
 
         if in_waiting > 0:
@@ -96,8 +118,12 @@ class RadarSensor:
             # This will block for up to serial timeout (1.0s) if nothing arrives
             chunk = self._data.read(4096)
             if not chunk:
-                return None   # timeout expired with no data — tell the caller to try again
+                return False   # timeout expired with no data — tell the caller to try again
             self._buffer.extend(chunk)
+        return True
+
+    def _extract_frame(self) -> bytes | None:
+        # Try to pull one complete frame off the front of self._buffer.
 
         # ── Desync recovery ───────────────────────────────────────────────────
         # If a corrupt frame_len value slipped through, the buffer can grow forever
@@ -132,8 +158,9 @@ class RadarSensor:
         if len(self._buffer) < 40:
             return None   # not enough bytes to read the header yet — wait for more data
 
-        # Bytes 12-15 of the packet header hold the total frame length as a little-endian uint32
-        frame_len = int.from_bytes(self._buffer[12:16], byteorder="little")
+        # Bytes 12-15 of the packet header hold the total frame length as a little-endian uint32.
+        # unpack_from reads it straight out of the bytearray — no 4-byte slice object per frame
+        frame_len = _U32.unpack_from(self._buffer, 12)[0]
 
         # Sanity check: reject lengths that are physically impossible for this radar profile
         # (minimum = bare header, maximum = 16 KB which is well above any real frame)
@@ -2,10 +2,11 @@ import sys
 import time
 import datetime
 import os
+import queue
 import logging
+import threading
 import zmq
 import numpy as np
-import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 import configparser
@@ -40,37 +41,100 @@ class RadarSessionWriter:
         
         self.metadata = metadata or {}
         self.metadata["session_start"] = self.start_time_str
+        # Frames are written exactly as the DSP produced them: raw uint16
+        # magnitudes (already half the footprint of float32). Record the dtype
+        # so readers never have to guess.
+        self.metadata["rdhm_dtype"] = "uint16"
+
+        # Timestamps are monotonic nanoseconds since session start — immune to
+        # NTP jumps mid-recording. The absolute wall-clock anchor goes into the
+        # metadata so readers can reconstruct epoch times.
+        self._t0_ns = time.perf_counter_ns()
+        self.metadata["t0_epoch"] = time.time()
+        self.metadata["timestamp_unit"] = "ns since session start (monotonic)"
         
-        self.data_buffer = []
         self.chunk_size = CHUNK_SIZE
         self.writer = None
         self.total_frames = 0
         self.schema_columns = ['timestamp', 'rdhm_bytes']
 
+        # Preallocated chunk buffers: timestamps and frame bytes are written
+        # into fixed slots instead of growing a list of per-frame dicts.
+        # The frame buffer is sized lazily on the first frame, since the
+        # byte-length is only known once the radar is configured.
+        self._timestamps = np.empty(self.chunk_size, dtype=np.int64)
+        self._frames = None   # becomes (chunk_size, frame_nbytes) uint8
+        self._count = 0
+
+        # Parquet encoding + compression run on a background thread so the
+        # radar read loop never stalls on disk I/O. maxsize=2 provides
+        # backpressure if the disk genuinely can't keep up.
+        self._flush_q = queue.Queue(maxsize=2)
+        self._flush_thread = threading.Thread(target=self._flush_worker, daemon=True)
+        self._flush_thread.start()
+
     def write_frame(self, rdhm_array: np.ndarray):
-        self.data_buffer.append({'timestamp': time.time(), 'rdhm_bytes': rdhm_array.tobytes()})
+        if self._frames is None or self._frames.shape[1] != rdhm_array.nbytes:
+            self._flush_buffer()   # safety: frame size changed mid-session
+            self._frames = np.empty((self.chunk_size, rdhm_array.nbytes), dtype=np.uint8)
+
+        self._timestamps[self._count] = time.perf_counter_ns() - self._t0_ns
+        # A uint8 view of the frame is assigned straight into the slot — one
+        # copy, no intermediate bytes object
+        self._frames[self._count] = rdhm_array.view(np.uint8)
+        self._count += 1
         self.total_frames += 1
-        
-        if len(self.data_buffer) >= self.chunk_size:
+
+        if self._count >= self.chunk_size:
             self._flush_buffer()
 
     def _flush_buffer(self):
-        if not self.data_buffer:
+        if self._count == 0:
             return
-            
-        df = pd.DataFrame(self.data_buffer, columns=self.schema_columns)
-        table = pa.Table.from_pandas(df)
-        
-        if self.writer is None:
-            schema_with_meta = table.schema.with_metadata({b"session_meta": str(self.metadata).encode()})
-            table = table.cast(schema_with_meta)
-            self.writer = pq.ParquetWriter(self.filepath, schema_with_meta)
-            
-        self.writer.write_table(table)
-        self.data_buffer.clear()
+
+        n = self._count
+        nbytes = self._frames.shape[1]
+
+        # Build the Arrow arrays directly: the frame column is one bulk copy
+        # of the contiguous chunk buffer wrapped as FixedSizeBinary — no
+        # per-frame bytes objects, no pandas round-trip.
+        # The timestamp slice must be copied: pa.array over a numpy array is
+        # zero-copy, and the flush thread serializes this table while the
+        # radar loop is already overwriting self._timestamps with the next
+        # chunk's values
+        ts_arr = pa.array(self._timestamps[:n].copy())
+        frame_arr = pa.Array.from_buffers(
+            pa.binary(nbytes), n,
+            [None, pa.py_buffer(self._frames[:n].tobytes())]
+        )
+        table = pa.Table.from_arrays([ts_arr, frame_arr], names=self.schema_columns)
+
+        # Both columns now own copies (tobytes for frames, .copy() for
+        # timestamps), so the chunk buffers can be reused immediately while
+        # the flush thread writes to disk
+        self._flush_q.put(table)
+        self._count = 0
+
+    def _flush_worker(self):
+        while True:
+            table = self._flush_q.get()
+            if table is None:   # sentinel pushed by close()
+                break
+
+            if self.writer is None:
+                schema_with_meta = table.schema.with_metadata({b"session_meta": str(self.metadata).encode()})
+                table = table.cast(schema_with_meta)
+                # Zstd compresses the uint16 heatmaps better than the default
+                # Snappy at comparable speed, and it runs off the radar loop
+                # on this thread anyway
+                self.writer = pq.ParquetWriter(self.filepath, schema_with_meta, compression='zstd')
+
+            self.writer.write_table(table)
 
     def close(self):
         self._flush_buffer()
+        self._flush_q.put(None)     # drain remaining chunks, then stop
+        self._flush_thread.join()
         if self.writer:
             self.writer.close()
             log.info(f"Session saved successfully: {self.filepath} ({self.total_frames} frames)")
@@ -119,24 +183,64 @@ def run_stream(zmq_socket: zmq.Socket, record: bool):
     else: log.info("PREVIEW MODE: Broadcasting over ZMQ only (No disk writing).")
 
     print("\n>>> STREAM ACTIVE. Press Ctrl+C to stop and return to menu. <<<\n")
-    
+
+    # Reader thread: pyserial releases the GIL inside its blocking C read,
+    # so draining the UART genuinely overlaps with the parse/send/record
+    # work below — throughput is bounded by max(I/O, parse), not their sum.
+    # The bounded queue gives backpressure if the consumer ever falls behind.
+    frame_q = queue.Queue(maxsize=16)
+    stop = threading.Event()
+
+    def _reader():
+        try:
+            while not stop.is_set():
+                # One serial drain can yield several complete frames if the
+                # consumer briefly fell behind — enqueue them all
+                for raw_bytes in radar.read_available_frames():
+                    while not stop.is_set():
+                        try:
+                            frame_q.put(raw_bytes, timeout=0.2)
+                            break
+                        except queue.Full:
+                            continue   # consumer stalled — keep trying, stay stoppable
+        except Exception as e:
+            # Serial failure (e.g. USB unplugged mid-stream): without this the
+            # daemon thread would die silently and the consumer would poll an
+            # empty queue forever. Signal shutdown and wake the consumer with
+            # a sentinel so the stream ends instead of hanging.
+            log.error(f"Radar read failed: {e}")
+            stop.set()
+            frame_q.put(None)
+
+    reader = threading.Thread(target=_reader, daemon=True)
+    reader.start()
+
     try:
         while True:
-            raw_bytes = radar.read_raw_frame()
+            try:
+                raw_bytes = frame_q.get(timeout=0.5)
+            except queue.Empty:
+                continue   # no frame yet — the blocking get replaces any sleep/poll
+
             if raw_bytes is None:
-                time.sleep(0.001)
-                continue
+                # Sentinel from the reader: the radar is gone — stop streaming
+                log.error("Radar disconnected. Stopping stream...")
+                break
 
             frame = parse_standard_frame(raw_bytes)
             rdhm = frame.get("RDHM")
-            
+
             if rdhm is not None:
-                zmq_socket.send(rdhm.tobytes())
+                # pyzmq accepts any buffer-protocol object, so the ndarray
+                # is sent directly — no tobytes() copy per frame
+                zmq_socket.send(rdhm)
                 if record: writer.write_frame(rdhm)
 
     except KeyboardInterrupt:
         log.info("Ctrl+C detected. Stopping stream...")
     finally:
+        stop.set()
+        reader.join(timeout=2.0)   # serial read blocks <= 1s, so this bounds shutdown
         radar.close()
         if writer: writer.close()
         time.sleep(0.5)
@@ -1,5 +1,4 @@
 import sys
-import time
 import logging
 import zmq
 import numpy as np
@@ -7,10 +6,11 @@ import scipy.ndimage as ndimage
 import pyqtgraph as pg
 import configparser
 
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import QThread, pyqtSignal, Qt, QMutex, QTimer
 from PyQt6.QtWidgets import QApplication, QMainWindow
 
 from core.base import RadarConfig, VERSION
+from core import kernels
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
 log = logging.getLogger("Subscriber")
@@ -31,6 +31,20 @@ DISP_LOW_PCT  = float(config['Viewer']['low_pct'])
 DISP_HIGH_PCT = float(config['Viewer']['high_pct'])
 SMOOTH_GRID   = int(config['Viewer']['smooth_grid_size'])
 
+# ─────────────────────────────────────────────────────────────────────────────
+#  Display helpers
+# ─────────────────────────────────────────────────────────────────────────────
+def histogram_levels(data: np.ndarray, low_pct: float, high_pct: float) -> tuple:
+    # Approximate percentiles via a 256-bin histogram + cumulative sum — one
+    # O(N) pass instead of the full sort np.percentile performs on every call.
+    # A quarter-dB of level error is invisible on the heatmap.
+    hist, edges = np.histogram(data, bins=256)
+    cdf = np.cumsum(hist)
+    total = cdf[-1]
+    lo = float(edges[np.searchsorted(cdf, total * low_pct / 100.0)])
+    hi = float(edges[min(np.searchsorted(cdf, total * high_pct / 100.0) + 1, 256)])
+    return lo, hi
+
 # ─────────────────────────────────────────────────────────────────────────────
 #  Pre-flight Connection Check
 # ─────────────────────────────────────────────────────────────────────────────
@@ -53,8 +67,7 @@ def is_publisher_active(ip: str, timeout_ms: int = 2000) -> bool:
 #  Background Network Thread
 # ─────────────────────────────────────────────────────────────────────────────
 class ZmqRadarWorker(QThread):
-    new_frame = pyqtSignal(np.ndarray)
-    error     = pyqtSignal(str)
+    error = pyqtSignal(str)
 
     def __init__(self, config: RadarConfig, publisher_ip: str):
         super().__init__()
@@ -66,32 +79,79 @@ class ZmqRadarWorker(QThread):
         self.max_bin = min(int(MAX_RANGE / config.rangeRes), config.numRangeBins)
         self._expected_size = self.num_range_bins * self.num_vel_bins
 
+        # Scratch buffer reused every frame — the dB pipeline below runs fully
+        # in place, so the only per-frame allocation left is the emitted copy.
+        self._db = np.empty((self.max_bin, self.num_vel_bins), dtype=np.float32)
+
+        # Single-slot "latest frame" holder: the worker overwrites it every
+        # frame and the GUI timer drains it at display rate, so a slow repaint
+        # never queues up stale frames — the display always shows the newest data.
+        # float16 is plenty for display dB values (~0.03 dB step) and halves
+        # the bytes moved through the slot in each direction.
+        self._latest       = np.empty(self._db.shape, dtype=np.float16)
+        self._latest_fresh = False   # True while _latest holds an unconsumed frame
+        self._latest_lock  = QMutex()
+
+        # Compile the frame kernels now (no-op without numba) so the first
+        # frame doesn't pay the JIT cost
+        kernels.warmup((self.max_bin, self.num_vel_bins))
+
         self.context = zmq.Context()
         self.socket = self.context.socket(zmq.SUB)
         self.socket.connect(f"tcp://{publisher_ip}:{ZMQ_PORT}")
         self.socket.setsockopt_string(zmq.SUBSCRIBE, "")
 
     def run(self):
+        # Hoist loop invariants out of the hot loop — each self.* access is a
+        # couple of dict probes that add up at frame rate
+        socket      = self.socket
+        expected    = self._expected_size
+        n_range     = self.num_range_bins
+        n_vel       = self.num_vel_bins
+        max_bin     = self.max_bin
+        db          = self._db
+        latest      = self._latest
+        lock        = self._latest_lock
+        shift_to_db = kernels.shift_to_db
+
         while self.running:
             try:
-                try:
-                    msg = self.socket.recv(flags=zmq.NOBLOCK)
-                except zmq.Again:
-                    time.sleep(0.001)
+                # Block inside zmq's poller instead of a sleep/retry spin;
+                # the 100 ms timeout keeps the self.running check responsive
+                if not socket.poll(timeout=100):
                     continue
+                msg = socket.recv(flags=zmq.NOBLOCK)
 
                 raw = np.frombuffer(msg, dtype=np.uint16)
-                if raw.size != self._expected_size: continue
+                if raw.size != expected: continue
 
-                rd = raw.astype(np.float32).reshape(self.num_range_bins, self.num_vel_bins)
-                rd = rd[:self.max_bin, :]
+                rd = raw.reshape(n_range, n_vel)[:max_bin, :]
 
-                display = 20.0 * np.log10(np.abs(np.fft.fftshift(rd, axes=1)) + 1e-6)
-                self.new_frame.emit(display)
+                # Fused kernel: Doppler shift + uint16 -> float32 + dB in a
+                # single pass from the raw view into the scratch buffer
+                shift_to_db(rd, db)
+
+                # Publish into the latest-frame slot; the GUI's render timer
+                # picks it up — frames it misses are simply replaced
+                lock.lock()
+                np.copyto(latest, db)
+                self._latest_fresh = True
+                lock.unlock()
 
             except Exception as e:
                 self.error.emit(str(e))
 
+    def take_latest(self, dst: np.ndarray) -> bool:
+        # Called from the GUI thread: copy the newest frame into `dst` and
+        # mark the slot consumed.  Returns False if nothing new arrived.
+        self._latest_lock.lock()
+        fresh = self._latest_fresh
+        if fresh:
+            np.copyto(dst, self._latest)
+            self._latest_fresh = False
+        self._latest_lock.unlock()
+        return fresh
+
     def stop(self):
         self.running = False
         self.wait()
@@ -107,6 +167,11 @@ class ViewerWindow(QMainWindow):
         self.cfg = config
         self.publisher_ip = publisher_ip
 
+        # Contrast levels are recalibrated every N frames rather than per
+        # frame — the noise floor moves far slower than the frame rate
+        self._levels_counter = 0
+        self._last_levels = None
+
         self._build_plot()
         self._precompute_zoom()
         self._start_worker()
@@ -141,22 +206,42 @@ class ViewerWindow(QMainWindow):
 
     def _start_worker(self):
         self.worker = ZmqRadarWorker(self.cfg, self.publisher_ip)
-        self.worker.new_frame.connect(self._on_frame)
+        self._disp = np.empty((self.worker.max_bin, self.worker.num_vel_bins), dtype=np.float32)
         self.worker.error.connect(lambda e: log.error(f"Worker Error: {e}"))
         self.worker.start()
 
-    def _on_frame(self, matrix: np.ndarray):
-        smooth = ndimage.zoom(matrix, (self._zoom_y, self._zoom_x), order=1)
-
-        lo = float(np.percentile(smooth, DISP_LOW_PCT))
-        hi = float(np.percentile(smooth, DISP_HIGH_PCT))
-        if lo >= hi: hi = lo + 0.1
-
-        self.img.setImage(smooth, autoLevels=False, levels=(lo, hi))
-        self.img.setRect(self._rect)
+        # Pull model: a ~30 Hz timer renders whatever is newest in the slot,
+        # fully decoupling acquisition rate from repaint rate
+        self._render_timer = QTimer(self)
+        self._render_timer.timeout.connect(self._on_frame)
+        self._render_timer.start(33)
+
+    def _on_frame(self):
+        # Nobody can see a minimized window — skip the zoom/levels/repaint
+        # work entirely; the latest-frame slot keeps the newest data for when
+        # the window comes back
+        if self.isMinimized() or not self.isVisible():
+            return
+
+        # Drain the worker's latest-frame slot; frames that arrived while we
+        # were still painting the previous one have already been replaced
+        if not self.worker.take_latest(self._disp):
+            return
+        smooth = ndimage.zoom(self._disp, (self._zoom_y, self._zoom_x), order=1)
+
+        if self._last_levels is None or self._levels_counter % 15 == 0:
+            lo, hi = histogram_levels(smooth, DISP_LOW_PCT, DISP_HIGH_PCT)
+            if lo >= hi: hi = lo + 0.1
+            self._last_levels = (lo, hi)
+        self._levels_counter += 1
+
+        # The image rect never changes after _build_plot, so it is set once
+        # there — re-applying it here would trigger a Qt geometry pass per frame
+        self.img.setImage(smooth, autoLevels=False, levels=self._last_levels)
 
     def closeEvent(self, event):
         log.info("Closing viewer window...")
+        self._render_timer.stop()
         self.worker.stop()
         event.accept()
 